@@ -45,7 +45,7 @@ class Data(Entity):
         self._association: DataAssociationEnum | None = None
         self._values = None
 
-        if "association" in kwargs.keys():
+        if "association" in kwargs:
             setattr(self, "association", kwargs["association"])
 
         super().__init__(**kwargs)
@@ -95,8 +95,8 @@ class Data(Entity):
     def association(self, value: str | DataAssociationEnum):
         if isinstance(value, str):
 
-            assert value.upper() in list(
-                DataAssociationEnum.__members__.keys()
+            assert (
+                value.upper() in DataAssociationEnum.__members__
             ), f"Association flag should be one of {list(DataAssociationEnum.__members__.keys())}"
 
             self._association = getattr(DataAssociationEnum, value.upper())
@@ -89,7 +89,7 @@ class DataType(EntityType):
 
     @color_map.setter
     def color_map(self, color_map: dict):
-        assert "values" in list(color_map.keys()), "'color_map' must contain 'values'"
+        assert "values" in color_map, "'color_map' must contain 'values'"
         self._color_map = ColorMap(**color_map)
         self.modified_attributes = "color_map"
 
@@ -122,7 +122,7 @@ class DataType(EntityType):
         if isinstance(value_map, dict):
             assert all(
                 np.issubdtype(type(val), np.integer) and (val >= 0)
-                for val in value_map.keys()
+                for val in value_map
             ), f"Value_map keys must be of integer type >= 0. Input values {value_map.keys()}"
             value_map = ReferenceValueMap(value_map)
 
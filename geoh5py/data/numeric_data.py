@@ -57,7 +57,7 @@ class NumericData(Data, ABC):
         stored and the expected number of cells or vertices.
         """
         if self.n_values is not None and len(values) < self.n_values:
-            full_vector = np.ones(self.n_values) * np.nan
+            full_vector = np.full(self.n_values, np.nan)
             full_vector[: len(np.ravel(values))] = np.ravel(values)
 
             return full_vector
@@ -70,8 +70,6 @@ class H5Reader:
         """
         with fetch_h5_handle(file) as h5file:
             name = list(h5file.keys())[0]
-            attributes: dict = {"entity": {}}
-            type_attributes: dict = {"entity_type": {}}
             property_groups: dict = {}
 
             entity_type = cls.format_type_string(entity_type)
@@ -83,19 +81,14 @@ class H5Reader:
             else:
                 entity = h5file[name][entity_type][cls.uuid_str(uid)]
 
-            for key, value in entity.attrs.items():
-                attributes["entity"][key] = value
-
-            for key, value in entity["Type"].attrs.items():
-                type_attributes["entity_type"][key] = value
+            attributes: dict = {"entity": dict(entity.attrs)}
+            type_attributes: dict = {"entity_type": dict(entity["Type"].attrs)}
 
             if "Color map" in entity["Type"].keys():
-                type_attributes["entity_type"]["color_map"] = {}
-                for key, value in entity["Type"]["Color map"].attrs.items():
-                    type_attributes["entity_type"]["color_map"][key] = value
-                type_attributes["entity_type"]["color_map"]["values"] = entity["Type"][
-                    "Color map"
-                ][:]
+                type_attributes["entity_type"]["color_map"] = dict(
+                    entity["Type"]["Color map"].attrs,
+                    values=entity["Type"]["Color map"][:],
+                )
 
             if "Value map" in entity["Type"].keys():
                 value_map = entity["Type"]["Value map"][:]
@@ -72,22 +72,23 @@ class BlockModel(ObjectBase):
             cell_center_z = np.cumsum(self.z_cells) - self.z_cells / 2.0
 
             angle = np.deg2rad(self.rotation)
-            rot = np.r_[
-                np.c_[np.cos(angle), -np.sin(angle), 0],
-                np.c_[np.sin(angle), np.cos(angle), 0],
-                np.c_[0, 0, 1],
-            ]
-
-            u_grid, v_grid, z_grid = np.meshgrid(
-                cell_center_u, cell_center_v, cell_center_z
+            cos_a, sin_a = np.cos(angle), np.sin(angle)
+            rot = np.array(
+                [[cos_a, -sin_a, 0.0], [sin_a, cos_a, 0.0], [0.0, 0.0, 1.0]]
             )
 
-            xyz = np.c_[np.ravel(u_grid), np.ravel(v_grid), np.ravel(z_grid)]
+            xyz = np.empty(
+                (cell_center_v.size, cell_center_u.size, cell_center_z.size, 3)
+            )
+            xyz[..., 0] = cell_center_u[None, :, None]
+            xyz[..., 1] = cell_center_v[:, None, None]
+            xyz[..., 2] = cell_center_z[None, None, :]
+            xyz = xyz.reshape((-1, 3))
 
             self._centroids = np.dot(rot, xyz.T).T
 
-            for ind, axis in enumerate(["x", "y", "z"]):
-                self._centroids[:, ind] += self.origin[axis]
+            origin = self.origin
+            self._centroids += np.r_[origin["x"], origin["y"], origin["z"]]
 
         return self._centroids
 
@@ -98,6 +99,16 @@ class BlockModel(ObjectBase):
         """
         return cls.__TYPE_UID
 
+    def _load_delimiters(self):
+        """
+        Fetch the cell delimiters along all three axes from the
+        :obj:`~geoh5py.workspace.workspace.Workspace`.
+        """
+        delimiters = self.workspace.fetch_delimiters(self.uid)
+        self._u_cell_delimiters = delimiters[0]
+        self._v_cell_delimiters = delimiters[1]
+        self._z_cell_delimiters = delimiters[2]
+
     @property
     def n_cells(self) -> int | None:
         """
@@ -147,7 +158,7 @@ class BlockModel(ObjectBase):
             self.modified_attributes = "attributes"
             self._centroids = None
 
-            self._rotation = value.astype(float)
+            self._rotation = float(value[0])
 
     @property
     def shape(self) -> tuple | None:
@@ -173,10 +184,7 @@ class BlockModel(ObjectBase):
         if (
             getattr(self, "_u_cell_delimiters", None) is None
         ) and self.existing_h5_entity:
-            delimiters = self.workspace.fetch_delimiters(self.uid)
-            self._u_cell_delimiters = delimiters[0]
-            self._v_cell_delimiters = delimiters[1]
-            self._z_cell_delimiters = delimiters[2]
+            self._load_delimiters()
 
         return self._u_cell_delimiters
 
@@ -209,10 +217,7 @@ class BlockModel(ObjectBase):
         if (
             getattr(self, "_v_cell_delimiters", None) is None
         ) and self.existing_h5_entity:
-            delimiters = self.workspace.fetch_delimiters(self.uid)
-            self._u_cell_delimiters = delimiters[0]
-            self._v_cell_delimiters = delimiters[1]
-            self._z_cell_delimiters = delimiters[2]
+            self._load_delimiters()
 
         return self._v_cell_delimiters
 
@@ -245,10 +250,7 @@ class BlockModel(ObjectBase):
         if (
             getattr(self, "_z_cell_delimiters", None) is None
         ) and self.existing_h5_entity:
-            delimiters = self.workspace.fetch_delimiters(self.uid)
-            self._u_cell_delimiters = delimiters[0]
-            self._v_cell_delimiters = delimiters[1]
-            self._z_cell_delimiters = delimiters[2]
+            self._load_delimiters()
 
         return self._z_cell_delimiters
 
@@ -59,20 +59,16 @@ class Curve(Points):
         """
         if getattr(self, "_cells", None) is None:
             if self._parts is not None:
-                cells = []
-                for part_id in self.unique_parts:
-                    ind = np.where(self.parts == part_id)[0]
-                    cells.append(np.c_[ind[:-1], ind[1:]])
-                self._cells = np.vstack(cells)
+                order = np.argsort(self.parts, kind="stable")
+                within = self.parts[order][:-1] == self.parts[order][1:]
+                self._cells = np.c_[order[:-1][within], order[1:][within]]
 
             elif self.existing_h5_entity:
                 self._cells = self.workspace.fetch_cells(self.uid)
             else:
                 if self.vertices is not None:
-                    n_segments = self.vertices.shape[0]
-                    self._cells = np.c_[
-                        np.arange(0, n_segments - 1), np.arange(1, n_segments)
-                    ].astype("uint32")
+                    indices = np.arange(self.vertices.shape[0], dtype="uint32")
+                    self._cells = np.c_[indices[:-1], indices[1:]]
 
         return self._cells
 
@@ -126,13 +122,9 @@ class Curve(Points):
 
             cells = self.cells
             parts = np.zeros(self.vertices.shape[0], dtype="int")
-            count = 0
-            for ind in range(1, cells.shape[0]):
-
-                if cells[ind, 0] != cells[ind - 1, 1]:
-                    count += 1
-
-                parts[cells[ind, :]] = count
+            count = np.zeros(cells.shape[0], dtype="int")
+            count[1:] = np.cumsum(cells[1:, 0] != cells[:-1, 1])
+            parts[cells.ravel()] = np.repeat(count, 2)
 
             self._parts = parts
 
@@ -60,9 +60,7 @@ class Drillhole(Points):
         self._trace: np.ndarray = None
         self._trace_depth: np.ndarray | None = None
         self._locations = None
-        self._deviation_x = None
-        self._deviation_y = None
-        self._deviation_z = None
+        self._deviations = None
 
         self._default_collocation_distance = 1e-2
 
@@ -128,55 +126,54 @@ class Drillhole(Points):
         assert isinstance(value, float), f"Provided cost value must be of type {float}"
         self._cost = value
 
+    @property
+    def deviations(self):
+        """
+        :obj:`numpy.ndarray`, shape (n_stations - 1, 3): Store the change in
+        x, y and z-coordinates along the well path between survey stations.
+        """
+        if getattr(self, "_deviations", None) is None and self.surveys is not None:
+            surveys = self.surveys
+            lengths = surveys["Depth"][1:] - surveys["Depth"][:-1]
+            azimuth = np.deg2rad(450.0 - surveys["Azimuth"] % 360.0)
+            dip = np.deg2rad(surveys["Dip"])
+            directions = np.c_[
+                np.cos(azimuth) * np.cos(dip),
+                np.sin(azimuth) * np.cos(dip),
+                np.sin(dip),
+            ]
+            dev_in, dev_out = directions[:-1], directions[1:]
+            ddev = (dev_out - dev_in) / lengths[:, None] / 2.0
+            self._deviations = dev_in + lengths[:, None] * ddev
+
+        return self._deviations
+
     @property
     def deviation_x(self):
         """
         :obj:`numpy.ndarray`: Store the change in x-coordinates along the well path.
         """
-        if getattr(self, "_deviation_x", None) is None and self.surveys is not None:
-            lengths = self.surveys["Depth"][1:] - self.surveys["Depth"][:-1]
-            dx_in = np.cos(
-                np.deg2rad(450.0 - self.surveys["Azimuth"][:-1] % 360.0)
-            ) * np.cos(np.deg2rad(self.surveys["Dip"][:-1]))
-            dx_out = np.cos(
-                np.deg2rad(450.0 - self.surveys["Azimuth"][1:] % 360.0)
-            ) * np.cos(np.deg2rad(self.surveys["Dip"][1:]))
-            ddx = (dx_out - dx_in) / lengths / 2.0
-            self._deviation_x = dx_in + lengths * ddx
-
-        return self._deviation_x
+        if self.deviations is not None:
+            return self.deviations[:, 0]
+        return None
 
     @property
     def deviation_y(self):
         """
         :obj:`numpy.ndarray`: Store the change in y-coordinates along the well path.
         """
-        if getattr(self, "_deviation_y", None) is None and self.surveys is not None:
-            lengths = self.surveys["Depth"][1:] - self.surveys["Depth"][:-1]
-            dy_in = np.sin(
-                np.deg2rad(450.0 - self.surveys["Azimuth"][:-1] % 360.0)
-            ) * np.cos(np.deg2rad(self.surveys["Dip"][:-1]))
-            dy_out = np.sin(
-                np.deg2rad(450.0 - self.surveys["Azimuth"][1:] % 360.0)
-            ) * np.cos(np.deg2rad(self.surveys["Dip"][1:]))
-            ddy = (dy_out - dy_in) / lengths / 2.0
-            self._deviation_y = dy_in + lengths * ddy
-
-        return self._deviation_y
+        if self.deviations is not None:
+            return self.deviations[:, 1]
+        return None
 
     @property
     def deviation_z(self):
         """
         :obj:`numpy.ndarray`: Store the change in z-coordinates along the well path.
         """
-        if getattr(self, "_deviation_z", None) is None and self.surveys is not None:
-            lengths = self.surveys["Depth"][1:] - self.surveys["Depth"][:-1]
-            dz_in = np.sin(np.deg2rad(self.surveys["Dip"][:-1]))
-            dz_out = np.sin(np.deg2rad(self.surveys["Dip"][1:]))
-            ddz = (dz_out - dz_in) / lengths / 2.0
-            self._deviation_z = dz_in + lengths * ddz
-
-        return self._deviation_z
+        if self.deviations is not None:
+            return self.deviations[:, 2]
+        return None
 
     @property
     def locations(self):
@@ -189,14 +186,10 @@ class Drillhole(Points):
             and self.surveys is not None
         ):
             lengths = self.surveys["Depth"][1:] - self.surveys["Depth"][:-1]
-            self._locations = np.c_[
-                self.collar["x"]
-                + np.cumsum(np.r_[0.0, lengths * self.deviation_x]).astype("float64"),
-                self.collar["y"]
-                + np.cumsum(np.r_[0.0, lengths * self.deviation_y]).astype("float64"),
-                self.collar["z"]
-                + np.cumsum(np.r_[0.0, lengths * self.deviation_z]).astype("float64"),
-            ]
+            deltas = np.empty((self.surveys.shape[0], 3), dtype="float64")
+            deltas[0, :] = [self.collar["x"], self.collar["y"], self.collar["z"]]
+            deltas[1:, :] = lengths[:, None] * self.deviations
+            self._locations = np.cumsum(deltas, axis=0)
 
         return self._locations
 
@@ -221,11 +214,12 @@ class Drillhole(Points):
         if (getattr(self, "_surveys", None) is None) and self.existing_h5_entity:
             surveys = self.workspace.fetch_coordinates(self.uid, "surveys")
             if len(surveys) == 1:
-                self.surveys = np.vstack(
+                self.surveys = np.concatenate(
                     [
                         np.c_[0, surveys["Azimuth"], surveys["Dip"]],
                         surveys.view("<f4").reshape((-1, 3)),
-                    ]
+                    ],
+                    axis=0,
                 )
             else:
                 self._surveys = surveys
@@ -238,7 +232,8 @@ class Drillhole(Points):
     @surveys.setter
     def surveys(self, value):
         if value is not None:
-            value = np.vstack(value)
+            if not (isinstance(value, np.ndarray) and value.ndim == 2):
+                value = np.vstack(value)
 
             assert value.shape[1] == 3, "'surveys' requires an ndarray of shape (*, 3)"
 
@@ -252,9 +247,7 @@ class Drillhole(Points):
             # Reset the trace
             self.modified_attributes = "trace"
             self._trace = None
-        self._deviation_x = None
-        self._deviation_y = None
-        self._deviation_z = None
+        self._deviations = None
         self._locations = None
 
     @property
@@ -345,13 +338,13 @@ class Drillhole(Points):
                 f"Given value to data {name} should of type {dict}. "
                 f"Type {type(attr)} given instead."
             )
-            assert "values" in list(
-                attr.keys()
+            assert (
+                "values" in attr
             ), f"Given attr for data {name} should include 'values'"
 
             attr["name"] = name
 
-            if "collocation_distance" in list(attr.keys()):
+            if "collocation_distance" in attr:
                 assert (
                     attr["collocation_distance"] > 0
                 ), "Input depth 'collocation_distance' must be >0."
@@ -359,7 +352,7 @@ class Drillhole(Points):
             else:
                 collocation_distance = self.default_collocation_distance
 
-            if "depth" in list(attr.keys()):
+            if "depth" in attr:
                 attr["association"] = "VERTEX"
                 attr["values"] = self.validate_log_data(
                     attr["depth"],
@@ -367,7 +360,7 @@ class Drillhole(Points):
                     collocation_distance=collocation_distance,
                 )
                 del attr["depth"]
-            elif "from-to" in list(attr.keys()):
+            elif "from-to" in attr:
                 attr["association"] = "CELL"
                 attr["values"] = self.validate_interval_data(
                     attr["from-to"],
@@ -424,11 +417,7 @@ class Drillhole(Points):
         locations = (
             self.locations[indices, :]
             + (depths - self.surveys["Depth"][indices])[:, None]
-            * np.c_[
-                self.deviation_x[indices],
-                self.deviation_y[indices],
-                self.deviation_z[indices],
-            ]
+            * self.deviations[indices, :]
         )
 
         return locations
@@ -442,7 +431,7 @@ class Drillhole(Points):
             self.vertices = xyz
         else:
             indices += self.vertices.shape[0]
-            self.vertices = np.vstack([self.vertices, xyz])
+            self.vertices = np.concatenate([self.vertices, xyz], axis=0)
 
         return indices.astype("uint32")
 
@@ -458,7 +447,8 @@ class Drillhole(Points):
 
         input_values = np.r_[input_values]
 
-        if self._depth is None:
+        depth_data = self._depth
+        if depth_data is None:
             self.workspace.create_entity(
                 Data,
                 entity={
@@ -468,30 +458,31 @@ class Drillhole(Points):
                 },
                 entity_type={"primitive_type": "FLOAT"},
             )
+            depth_data = self._depth
 
-        if self._depth.values is None:  # First data appended
+        if depth_data.values is None:  # First data appended
             self.add_vertices(self.desurvey(depth))
-            depth = np.r_[np.ones(self.n_vertices - depth.shape[0]) * np.nan, depth]
+            depth = np.r_[np.full(self.n_vertices - depth.shape[0], np.nan), depth]
             values = np.r_[
-                np.ones(self.n_vertices - input_values.shape[0]) * np.nan, input_values
+                np.full(self.n_vertices - input_values.shape[0], np.nan), input_values
             ]
-            self._depth.values = depth
+            depth_data.values = depth
 
         else:
             depths, indices = merge_arrays(
-                self._depth.values,
+                depth_data.values,
                 depth,
                 return_mapping=True,
                 collocation_distance=collocation_distance,
             )
             values = merge_arrays(
-                np.ones(self.n_vertices) * np.nan,
+                np.full(self.n_vertices, np.nan),
                 input_values,
                 replace="B->A",
                 mapping=indices,
             )
             self.add_vertices(self.desurvey(np.delete(depth, indices[:, 1])))
-            self._depth.values = depths
+            depth_data.values = depths
             self.workspace.finalize()
 
         return values
@@ -501,6 +492,7 @@ class Drillhole(Points):
         Compare new and current depth values, append new vertices if necessary and return
         an augmented values vector that matches the vertices indexing.
         """
+        # pylint: disable=R0914
         if isinstance(from_to, list):
             from_to = np.vtack(from_to)
 
@@ -510,7 +502,9 @@ class Drillhole(Points):
         )
         assert from_to.shape[1] == 2, "The `from-to` values must have shape(*, 2)"
 
-        if (self._from is None) and (self._to is None):
+        from_data = self._from
+        to_data = self._to
+        if (from_data is None) and (to_data is None):
             uni_depth, inv_map = np.unique(from_to, return_inverse=True)
             self.cells = self.add_vertices(self.desurvey(uni_depth))[inv_map].reshape(
                 (-1, 2)
@@ -537,41 +531,41 @@ class Drillhole(Points):
             )
         else:
             from_ind = match_values(
-                self._from.values,
+                from_data.values,
                 from_to[:, 0],
                 collocation_distance=collocation_distance,
             )
             to_ind = match_values(
-                self._to.values,
+                to_data.values,
                 from_to[:, 1],
                 collocation_distance=collocation_distance,
             )
 
             # Find matching cells
-            in_match = np.ones((self._from.values.shape[0], 2)) * np.nan
+            in_match = np.full((from_data.values.shape[0], 2), np.nan)
             in_match[from_ind[:, 0], 0] = from_ind[:, 1]
             in_match[to_ind[:, 0], 1] = to_ind[:, 1]
 
-            out_match = np.ones_like(from_to) * np.nan
+            out_match = np.full(from_to.shape, np.nan)
             out_match[from_ind[:, 1], 0] = from_ind[:, 0]
             out_match[to_ind[:, 1], 1] = to_ind[:, 0]
 
             cell_map = np.c_[
-                np.where(in_match[:, 0] == in_match[:, 1])[0],
-                np.where(out_match[:, 0] == out_match[:, 1])[0],
+                np.flatnonzero(in_match[:, 0] == in_match[:, 1]),
+                np.flatnonzero(out_match[:, 0] == out_match[:, 1]),
             ]
 
             # Add vertices
             vert_new = np.ones_like(from_to, dtype="bool")
             vert_new[from_ind[:, 1], 0] = False
             vert_new[to_ind[:, 1], 1] = False
-            ind_new = np.where(vert_new.flatten())[0]
+            ind_new = np.flatnonzero(vert_new)
             uni_new, inv_map = np.unique(
                 from_to.flatten()[ind_new], return_inverse=True
             )
 
             # Add cells
-            new_cells = np.ones_like(from_to.flatten()) * np.nan
+            new_cells = np.full(from_to.size, np.nan)
             new_cells[ind_new] = self.add_vertices(self.desurvey(uni_new))[inv_map]
             new_cells = new_cells.reshape((-1, 2))
             new_cells[from_ind[:, 1], 0] = self.cells[from_ind[:, 0], 0]
@@ -580,16 +574,16 @@ class Drillhole(Points):
 
             # Append values
             input_values = merge_arrays(
-                np.ones(self.n_cells) * np.nan,
+                np.full(self.n_cells, np.nan),
                 np.r_[input_values],
                 replace="B->A",
                 mapping=cell_map,
             )
-            self._from.values = merge_arrays(
-                self._from.values, from_to[:, 0], mapping=cell_map
+            from_data.values = merge_arrays(
+                from_data.values, from_to[:, 0], mapping=cell_map
             )
-            self._to.values = merge_arrays(
-                self._to.values, from_to[:, 1], mapping=cell_map
+            to_data.values = merge_arrays(
+                to_data.values, from_to[:, 1], mapping=cell_map
             )
             self.cells = np.r_[self.cells, new_cells.astype("uint32")]
 
@@ -599,11 +593,12 @@ class Drillhole(Points):
         """
         Read the 'DEPTH' data and sort all Data.values if needed
         """
-        if self.get_data("DEPTH"):
-            data_obj = self.get_data("DEPTH")[0]
+        depth_data = self.get_data("DEPTH")
+        if depth_data:
+            data_obj = depth_data[0]
             depths = data_obj.check_vector_length(data_obj.values)
             if not np.all(np.diff(depths) >= 0):
-                sort_ind = np.argsort(depths)
+                sort_ind = np.argsort(depths, kind="stable")
 
                 for child in self.children:
                     if isinstance(child, Data) and child.association.name == "VERTEX":
@@ -613,7 +608,9 @@ class Drillhole(Points):
                     self.vertices = self.vertices[sort_ind, :]
 
                 if self.cells is not None:
-                    key_map = np.argsort(sort_ind)[self.cells.flatten()]
+                    inverse_map = np.empty_like(sort_ind)
+                    inverse_map[sort_ind] = np.arange(sort_ind.shape[0])
+                    key_map = inverse_map[self.cells.flatten()]
                     self.cells = key_map.reshape((-1, 2)).astype("uint32")
 
         self.workspace.finalize()
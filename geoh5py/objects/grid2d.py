@@ -74,10 +74,7 @@ class Grid2D(ObjectBase):
         Cell center local coordinate along the u-axis.
         """
         if self.u_count is not None and self.u_cell_size is not None:
-            return (
-                np.cumsum(np.ones(self.u_count) * self.u_cell_size)
-                - self.u_cell_size / 2.0
-            )
+            return (np.arange(self.u_count) + 0.5) * self.u_cell_size
         return None
 
     @property
@@ -87,10 +84,7 @@ class Grid2D(ObjectBase):
         The cell center local coordinate along the v-axis.
         """
         if self.v_count is not None and self.v_cell_size is not None:
-            return (
-                np.cumsum(np.ones(self.v_count) * self.v_cell_size)
-                - self.v_cell_size / 2.0
-            )
+            return (np.arange(self.v_count) + 0.5) * self.v_cell_size
         return None
 
     @property
@@ -108,31 +102,37 @@ class Grid2D(ObjectBase):
                 [x_N, y_N, z_N]
             ]
         """
-        if (
-            getattr(self, "_centroids", None) is None
-            and self.cell_center_u is not None
-            and self.cell_center_v is not None
-            and self.n_cells is not None
-            and self.origin is not None
-        ):
+        if getattr(self, "_centroids", None) is None:
+            cell_center_u = self.cell_center_u
+            cell_center_v = self.cell_center_v
+            if (
+                cell_center_u is None
+                or cell_center_v is None
+                or self.n_cells is None
+                or self.origin is None
+            ):
+                return self._centroids
             angle = np.deg2rad(self.rotation)
-            rot = np.r_[
-                np.c_[np.cos(angle), -np.sin(angle), 0],
-                np.c_[np.sin(angle), np.cos(angle), 0],
-                np.c_[0, 0, 1],
-            ]
-            u_grid, v_grid = np.meshgrid(self.cell_center_u, self.cell_center_v)
+            cos_a, sin_a = np.cos(angle), np.sin(angle)
+            rot = np.array(
+                [[cos_a, -sin_a, 0.0], [sin_a, cos_a, 0.0], [0.0, 0.0, 1.0]]
+            )
+            xyz = np.zeros((cell_center_v.size, cell_center_u.size, 3))
 
             if self.vertical:
-                xyz = np.c_[np.ravel(u_grid), np.zeros(self.n_cells), np.ravel(v_grid)]
+                xyz[..., 0] = cell_center_u[None, :]
+                xyz[..., 2] = cell_center_v[:, None]
 
             else:
-                xyz = np.c_[np.ravel(u_grid), np.ravel(v_grid), np.zeros(self.n_cells)]
+                xyz[..., 0] = cell_center_u[None, :]
+                xyz[..., 1] = cell_center_v[:, None]
+
+            xyz = xyz.reshape((-1, 3))
 
             centroids = np.asarray(np.dot(rot, xyz.T).T)
 
-            for ind, axis in enumerate(["x", "y", "z"]):
-                centroids[:, ind] += self.origin[axis]
+            origin = self.origin
+            centroids += np.r_[origin["x"], origin["y"], origin["z"]]
 
             self._centroids = centroids
 
@@ -208,7 +208,7 @@ class Grid2D(ObjectBase):
             self.modified_attributes = "attributes"
             self._centroids = None
 
-            self._rotation = value.astype(float)
+            self._rotation = float(value[0])
 
     @property
     def shape(self) -> tuple | None:
@@ -252,7 +252,7 @@ class Grid2D(ObjectBase):
             self.modified_attributes = "attributes"
             self._centroids = None
 
-            self._u_count = int(value)
+            self._u_count = int(value[0])
 
     @property
     def v_cell_size(self) -> float | None:
@@ -286,7 +286,7 @@ class Grid2D(ObjectBase):
             self.modified_attributes = "attributes"
             self._centroids = None
 
-            self._v_count = int(value)
+            self._v_count = int(value[0])
 
     @property
     def vertical(self) -> bool | None:
@@ -118,8 +118,8 @@ class ObjectBase(Entity):
                 f"Given value to data {name} should of type {dict}. "
                 f"Type {type(attr)} given instead."
             )
-            assert "values" in list(
-                attr.keys()
+            assert (
+                "values" in attr
             ), f"Given attr for data {name} should include 'values'"
 
             attr["name"] = name
@@ -171,10 +171,11 @@ class ObjectBase(Entity):
         else:
             uids = self.reference_to_uid(data)
 
+        children_uid = {child.uid for child in self.children}
         for uid in uids:
-            assert uid in [
-                child.uid for child in self.children
-            ], f"Given data with uuid {uid} does not match any known children"
+            assert (
+                uid in children_uid
+            ), f"Given data with uuid {uid} does not match any known children"
             if uid not in prop_group.properties:
                 prop_group.properties.append(uid)
                 self.modified_attributes = "property_groups"
@@ -277,13 +278,13 @@ class ObjectBase(Entity):
 
         :return: A new or existing :obj:`~geoh5py.groups.property_group.PropertyGroup`
         """
-        if "name" in list(kwargs.keys()) and any(
-            pg.name == kwargs["name"] for pg in self.property_groups
-        ):
-            prop_group = [
-                pg for pg in self.property_groups if pg.name == kwargs["name"]
-            ][0]
-        else:
+        prop_group = None
+        if "name" in kwargs:
+            prop_group = next(
+                (pg for pg in self.property_groups if pg.name == kwargs["name"]), None
+            )
+
+        if prop_group is None:
             prop_group = PropertyGroup(**kwargs)
             self.property_groups = [prop_group]
 
@@ -356,11 +357,16 @@ class ObjectBase(Entity):
     @property_groups.setter
     def property_groups(self, prop_groups: list[PropertyGroup]):
         # Check for existing property_group
+        existing_uids = {pg.uid for pg in self.property_groups}
+        existing_names = {pg.name for pg in self.property_groups}
         for prop_group in prop_groups:
-            if not any(
-                pg.uid == prop_group.uid for pg in self.property_groups
-            ) and not any(pg.name == prop_group.name for pg in self.property_groups):
+            if (
+                prop_group.uid not in existing_uids
+                and prop_group.name not in existing_names
+            ):
                 prop_group.parent = self
+                existing_uids.add(prop_group.uid)
+                existing_names.add(prop_group.name)
 
                 self.modified_attributes = "property_groups"
                 self._property_groups = self.property_groups + [prop_group]
@@ -378,7 +384,7 @@ class ObjectBase(Entity):
         Get a dictionary of attributes and validate the data 'association' keyword.
         """
 
-        if "association" in list(attribute_dict.keys()):
+        if "association" in attribute_dict:
             assert attribute_dict["association"] in [
                 enum.name for enum in DataAssociationEnum
             ], (
@@ -388,14 +394,15 @@ class ObjectBase(Entity):
             )
         else:
             attribute_dict["association"] = "OBJECT"
+            n_values = attribute_dict["values"].ravel().shape[0]
             if (
                 getattr(self, "n_cells", None) is not None
-                and attribute_dict["values"].ravel().shape[0] == self.n_cells
+                and n_values == self.n_cells
             ):
                 attribute_dict["association"] = "CELL"
             elif (
                 getattr(self, "n_vertices", None) is not None
-                and attribute_dict["values"].ravel().shape[0] == self.n_vertices
+                and n_values == self.n_vertices
             ):
                 attribute_dict["association"] = "VERTEX"
 
@@ -405,11 +412,11 @@ class ObjectBase(Entity):
         Get a dictionary of attributes and validate the type of data.
         """
 
-        if "entity_type" in list(attribute_dict.keys()):
+        if "entity_type" in attribute_dict:
             entity_type = attribute_dict["entity_type"]
-        elif "type" in list(attribute_dict.keys()):
-            assert attribute_dict["type"].upper() in list(
-                PrimitiveTypeEnum.__members__.keys()
+        elif "type" in attribute_dict:
+            assert (
+                attribute_dict["type"].upper() in PrimitiveTypeEnum.__members__
             ), f"Data 'type' should be one of {list(PrimitiveTypeEnum.__members__.keys())}"
             entity_type = {"primitive_type": attribute_dict["type"].upper()}
         else:
@@ -66,12 +66,9 @@ class ObjectType(EntityType):
         :return: A new instance of GroupType.
         """
         uid = uuid.uuid4()
-        if getattr(entity_class, "default_type_uid", None) is not None:
-            uid = entity_class.default_type_uid()
-            if "ID" in list(kwargs.keys()):
-                kwargs["ID"] = uid
-            else:
-                kwargs["uid"] = uid
+        default_type_uid = getattr(entity_class, "default_type_uid", None)
+        if default_type_uid is not None:
+            uid = default_type_uid()
         else:
             for key, val in kwargs.items():
                 if key.lower() in ["id", "uid"]:
@@ -81,4 +78,10 @@ class ObjectType(EntityType):
         if entity_type is not None:
             return entity_type
 
+        if default_type_uid is not None:
+            if "ID" in kwargs:
+                kwargs["ID"] = uid
+            else:
+                kwargs["uid"] = uid
+
         return cls(workspace, **kwargs)
@@ -23,6 +23,8 @@ import numpy as np
 
 from .object_base import ObjectBase, ObjectType
 
+_OCTREE_DTYPE = np.dtype([("I", "<i4"), ("J", "<i4"), ("K", "<i4"), ("NCells", "<i4")])
+
 
 class Octree(ObjectBase):
     """
@@ -88,24 +90,20 @@ class Octree(ObjectBase):
         add_v = int(level_v - min_level)
         add_w = int(level_w - min_level)
 
-        j, k, i = np.meshgrid(
-            np.arange(0, self.v_count, 2 ** (level_v - add_v - level)),
-            np.arange(0, self.w_count, 2 ** (level_w - add_w - level)),
-            np.arange(0, self.u_count, 2 ** (level_u - add_u - level)),
-        )
+        arange_u = np.arange(0, self.u_count, 2 ** (level_u - add_u - level))
+        arange_v = np.arange(0, self.v_count, 2 ** (level_v - add_v - level))
+        arange_w = np.arange(0, self.w_count, 2 ** (level_w - add_w - level))
 
-        octree_cells = np.c_[
-            i.flatten(),
-            j.flatten(),
-            k.flatten(),
-            np.ones_like(i.flatten()) * 2 ** (min_level - level),
-        ]
-
-        self._octree_cells = np.rec.fromarrays(
-            octree_cells.T,
-            names=["I", "J", "K", "NCells"],
-            formats=["<i4", "<i4", "<i4", "<i4"],
+        octree_cells = np.empty(
+            arange_u.size * arange_v.size * arange_w.size, dtype=_OCTREE_DTYPE
         )
+        grid = octree_cells.reshape((arange_w.size, arange_v.size, arange_u.size))
+        grid["I"] = arange_u[None, None, :]
+        grid["J"] = arange_v[None, :, None]
+        grid["K"] = arange_w[:, None, None]
+        grid["NCells"] = 2 ** (min_level - level)
+
+        self._octree_cells = octree_cells
 
     @property
     def centroids(self):
@@ -129,28 +127,30 @@ class Octree(ObjectBase):
             assert self.w_cell_size is not None, "w_cell_size must be set"
 
             angle = np.deg2rad(self.rotation)
-            rot = np.r_[
-                np.c_[np.cos(angle), -np.sin(angle), 0],
-                np.c_[np.sin(angle), np.cos(angle), 0],
-                np.c_[0, 0, 1],
-            ]
+            cos_a, sin_a = np.cos(angle), np.sin(angle)
 
-            u_grid = (
-                self.octree_cells["I"] + self.octree_cells["NCells"] / 2.0
-            ) * self.u_cell_size
-            v_grid = (
-                self.octree_cells["J"] + self.octree_cells["NCells"] / 2.0
-            ) * self.v_cell_size
-            w_grid = (
-                self.octree_cells["K"] + self.octree_cells["NCells"] / 2.0
-            ) * self.w_cell_size
+            octree_cells = self.octree_cells
 
-            xyz = np.c_[u_grid, v_grid, w_grid]
+            # Unpack the strided record fields once into contiguous columns
+            ind_u = np.ascontiguousarray(octree_cells["I"])
+            ind_v = np.ascontiguousarray(octree_cells["J"])
+            ind_w = np.ascontiguousarray(octree_cells["K"])
+            half = octree_cells["NCells"] / 2.0
 
-            self._centroids = np.dot(rot, xyz.T).T
+            xyz = np.empty((octree_cells.shape[0], 3))
+            xyz[:, 0] = (ind_u + half) * self.u_cell_size
+            xyz[:, 1] = (ind_v + half) * self.v_cell_size
+            xyz[:, 2] = (ind_w + half) * self.w_cell_size
 
-            for ind, axis in enumerate(["x", "y", "z"]):
-                self._centroids[:, ind] += self.origin[axis]
+            # Rotation about the vertical axis only mixes the x and y columns
+            x_loc = xyz[:, 0].copy()
+            xyz[:, 0] = cos_a * x_loc - sin_a * xyz[:, 1]
+            xyz[:, 1] = sin_a * x_loc + cos_a * xyz[:, 1]
+
+            # The (x, y, z) origin fields are three contiguous float64
+            xyz += self.origin.reshape(1).view("<f8")
+
+            self._centroids = xyz
 
         return self._centroids
 
@@ -158,6 +158,21 @@ class Octree(ObjectBase):
     def default_type_uid(cls) -> uuid.UUID:
         return cls.__TYPE_UID
 
+    def _set_scalar(self, name: str, value, dtype: type):
+        """
+        Validate and store a scalar attribute given as a number or (1,) array,
+        invalidating the cached centroids.
+        """
+        if value is not None:
+            value = np.r_[value]
+            assert (
+                len(value) == 1
+            ), f"{name} must be type({dtype.__name__}) of shape (1,)"
+            self.modified_attributes = "attributes"
+            self._centroids = None
+
+            setattr(self, f"_{name}", dtype(value[0]))
+
     @property
     def n_cells(self) -> int | None:
         """
@@ -197,25 +212,24 @@ class Octree(ObjectBase):
     def octree_cells(self, value):
 
         if value is not None:
-            dtypes = [("I", "<i4"), ("J", "<i4"), ("K", "<i4"), ("NCells", "<i4")]
             if len(value.dtype) > 1:
-                dtype = np.dtype(dtypes)
                 assert (
-                    value.dtype == dtype
-                ), f"Input of type {np.ndarray} must be of {dtype}"
+                    value.dtype == _OCTREE_DTYPE
+                ), f"Input of type {np.ndarray} must be of {_OCTREE_DTYPE}"
                 self._octree_cells = value
             else:
-                value = np.vstack(value)
+                if not (isinstance(value, np.ndarray) and value.ndim == 2):
+                    value = np.vstack(value)
                 assert (
                     value.shape[1] == 4
                 ), "'octree_cells' requires an ndarray of shape (*, 4)"
                 self.modified_attributes = "octree_cells"
                 self._centroids = None
 
-                self._octree_cells = np.asarray(
-                    np.core.records.fromarrays(
-                        value.T, names="I, J, K, NCells", formats="<i4, <i4, <i4, <i4"
-                    )
+                self._octree_cells = (
+                    np.ascontiguousarray(value, dtype="<i4")
+                    .view(_OCTREE_DTYPE)
+                    .reshape(-1)
                 )
 
     @property
@@ -233,12 +247,28 @@ class Octree(ObjectBase):
 
             assert len(value) == 3, "Origin must be a list or numpy array of shape (3,)"
 
-            self.modified_attributes = "attributes"
-            self._centroids = None
-
             value = np.asarray(
                 tuple(value), dtype=[("x", float), ("y", float), ("z", float)]
             )
+            previous = self._origin
+
+            if isinstance(previous, np.ndarray) and value == previous:
+                return
+
+            self.modified_attributes = "attributes"
+
+            if (
+                isinstance(previous, np.ndarray)
+                and getattr(self, "_centroids", None) is not None
+            ):
+                # Cached centroids only translate by the change in origin.
+                # Add into a new array so previously returned ones are untouched.
+                self._centroids = self._centroids + (
+                    value.reshape(1).view("<f8") - previous.reshape(1).view("<f8")
+                )
+            else:
+                self._centroids = None
+
             self._origin = value
 
     @property
@@ -250,13 +280,7 @@ class Octree(ObjectBase):
 
     @rotation.setter
     def rotation(self, value):
-        if value is not None:
-            value = np.r_[value]
-            assert len(value) == 1, "Rotation angle must be a float of shape (1,)"
-            self.modified_attributes = "attributes"
-            self._centroids = None
-
-            self._rotation = value.astype(float)
+        self._set_scalar("rotation", value, float)
 
     @property
     def shape(self) -> tuple | None:
@@ -280,13 +304,7 @@ class Octree(ObjectBase):
 
     @u_cell_size.setter
     def u_cell_size(self, value):
-        if value is not None:
-            value = np.r_[value]
-            assert len(value) == 1, "u_cell_size must be type(float) of shape (1,)"
-            self.modified_attributes = "attributes"
-            self._centroids = None
-
-            self._u_cell_size = value.astype(float)
+        self._set_scalar("u_cell_size", value, float)
 
     @property
     def u_count(self) -> int | None:
@@ -297,13 +315,7 @@ class Octree(ObjectBase):
 
     @u_count.setter
     def u_count(self, value):
-        if value is not None:
-            value = np.r_[value]
-            assert len(value) == 1, "u_count must be type(int) of shape (1,)"
-            self.modified_attributes = "attributes"
-            self._centroids = None
-
-            self._u_count = int(value)
+        self._set_scalar("u_count", value, int)
 
     @property
     def v_cell_size(self) -> float | None:
@@ -314,13 +326,7 @@ class Octree(ObjectBase):
 
     @v_cell_size.setter
     def v_cell_size(self, value):
-        if value is not None:
-            value = np.r_[value]
-            assert len(value) == 1, "v_cell_size must be type(float) of shape (1,)"
-            self.modified_attributes = "attributes"
-            self._centroids = None
-
-            self._v_cell_size = value.astype(float)
+        self._set_scalar("v_cell_size", value, float)
 
     @property
     def v_count(self) -> int | None:
@@ -331,13 +337,7 @@ class Octree(ObjectBase):
 
     @v_count.setter
     def v_count(self, value):
-        if value is not None:
-            value = np.r_[value]
-            assert len(value) == 1, "v_count must be type(int) of shape (1,)"
-            self.modified_attributes = "attributes"
-            self._centroids = None
-
-            self._v_count = int(value)
+        self._set_scalar("v_count", value, int)
 
     @property
     def w_cell_size(self) -> float | None:
@@ -348,13 +348,7 @@ class Octree(ObjectBase):
 
     @w_cell_size.setter
     def w_cell_size(self, value):
-        if value is not None:
-            value = np.r_[value]
-            assert len(value) == 1, "w_cell_size must be type(float) of shape (1,)"
-            self.modified_attributes = "attributes"
-            self._centroids = None
-
-            self._w_cell_size = value.astype(float)
+        self._set_scalar("w_cell_size", value, float)
 
     @property
     def w_count(self) -> int | None:
@@ -365,10 +359,4 @@ class Octree(ObjectBase):
 
     @w_count.setter
     def w_count(self, value):
-        if value is not None:
-            value = np.r_[value]
-            assert len(value) == 1, "w_count must be type(int) of shape (1,)"
-            self.modified_attributes = "attributes"
-            self._centroids = None
-
-            self._w_count = int(value)
+        self._set_scalar("w_count", value, int)
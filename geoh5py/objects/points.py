@@ -61,9 +61,10 @@ class Points(ObjectBase):
         assert (
             xyz.shape[1] == 3
         ), f"Array of vertices must be of shape (*, 3). Array of shape {xyz.shape} provided."
-        self._vertices = np.asarray(
-            np.core.records.fromarrays(
-                xyz.T.tolist(),
-                dtype=[("x", "<f8"), ("y", "<f8"), ("z", "<f8")],
-            )
+        vertices = np.empty(
+            xyz.shape[0], dtype=[("x", "<f8"), ("y", "<f8"), ("z", "<f8")]
         )
+        vertices["x"] = xyz[:, 0]
+        vertices["y"] = xyz[:, 1]
+        vertices["z"] = xyz[:, 2]
+        self._vertices = vertices
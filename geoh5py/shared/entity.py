@@ -57,12 +57,12 @@ class Entity(ABC):
         self._metadata = None
         self._modified_attributes: list[str] = []
 
-        if "parent" in kwargs.keys():
+        if "parent" in kwargs:
             setattr(self, "parent", kwargs["parent"])
 
         for attr, item in kwargs.items():
             try:
-                if attr in self._attribute_map.keys():
+                if attr in self._attribute_map:
                     attr = self._attribute_map[attr]
                 setattr(self, attr, item)
             except AttributeError:
@@ -159,7 +159,7 @@ class Entity(ABC):
 
         :return entity: Registered Entity to the workspace.
         """
-        if "entity_type_uid" in kwargs.keys():
+        if "entity_type_uid" in kwargs:
             entity_type_kwargs = {"entity_type": {"uid": kwargs["entity_type_uid"]}}
         else:
             entity_type_kwargs = {}
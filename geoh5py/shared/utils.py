@@ -63,15 +63,24 @@ def match_values(vec_a, vec_b, collocation_distance=1e-4):
         Pairs of indices for matching values between the two arrays such
         that vec_a[ind[:, 0]] == vec_b[ind[:, 1]].
     """
-    ind_sort = np.argsort(vec_a)
+    if np.all(vec_a[:-1] <= vec_a[1:]):  # Skip the sort if already ordered
+        ind_sort = None
+        sorted_a = vec_a
+    else:
+        ind_sort = np.argsort(vec_a)
+        sorted_a = vec_a[ind_sort]
+
     ind = np.minimum(
-        np.searchsorted(vec_a[ind_sort], vec_b, side="right"), vec_a.shape[0] - 1
+        np.searchsorted(sorted_a, vec_b, side="right"), vec_a.shape[0] - 1
     )
     nearests = np.c_[ind, ind - 1]
-    match = np.where(
-        np.abs(vec_a[ind_sort][nearests] - vec_b[:, None]) < collocation_distance
-    )
-    indices = np.c_[ind_sort[nearests[match[0], match[1]]], match[0]]
+    match = np.where(np.abs(sorted_a[nearests] - vec_b[:, None]) < collocation_distance)
+    matched = nearests[match[0], match[1]]
+
+    if ind_sort is not None:
+        matched = ind_sort[matched]
+
+    indices = np.c_[matched, match[0]]
     return indices
 
 
@@ -126,16 +135,14 @@ def compare_entities(object_a, object_b, ignore: list | None = None):
     for attr in object_a.__dict__.keys():
         if attr in ignore_list:
             continue
-        if isinstance(getattr(object_a, attr[1:]), ABC):
-            compare_entities(
-                getattr(object_a, attr[1:]), getattr(object_b, attr[1:]), ignore=ignore
-            )
+        attr_a = getattr(object_a, attr[1:])
+        attr_b = getattr(object_b, attr[1:])
+        if isinstance(attr_a, ABC):
+            compare_entities(attr_a, attr_b, ignore=ignore)
         else:
-            if isinstance(getattr(object_a, attr[1:]), np.ndarray):
-                np.testing.assert_array_equal(
-                    getattr(object_a, attr[1:]), getattr(object_b, attr[1:])
-                )
+            if isinstance(attr_a, np.ndarray):
+                np.testing.assert_array_equal(attr_a, attr_b)
             else:
                 assert np.all(
-                    getattr(object_a, attr[1:]) == getattr(object_b, attr[1:])
+                    attr_a == attr_b
                 ), f"Output attribute '{attr[1:]}' for {object_a} do not match input {object_b}"
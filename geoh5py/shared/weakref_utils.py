@@ -51,10 +51,10 @@ def get_clean_ref(some_dict: dict[K, ReferenceType[T]], key: K) -> T | None:
     ref = some_dict.get(key, None)
     if ref is None:
         return None
-    if ref() is None:
+    referent = ref()
+    if referent is None:
         del some_dict[key]
-        return None
-    return ref()
+    return referent
 
 
 def insert_once(some_dict: dict[K, ReferenceType], key: K, value):
@@ -81,7 +81,7 @@ class Workspace:
 
         for attr, item in kwargs.items():
             try:
-                if attr in self._attribute_map.keys():
+                if attr in self._attribute_map:
                     attr = self._attribute_map[attr]
                 setattr(self, attr, item)
             except AttributeError:
@@ -114,8 +114,8 @@ class Workspace:
         if active_one is None:
             raise RuntimeError("No active workspace.")
 
-        # so that type check does not complain of possible returned None
-        return cast(Workspace, active_one)
+        # the None check above is enough for type narrowing
+        return active_one
 
     def _all_data(self) -> list[data.Data]:
         """Get all active Data entities registered in the workspace."""
@@ -165,9 +165,19 @@ class Workspace:
 
         :return: The Entity registered to the workspace.
         """
+        new_object = self._copy_to_parent(entity, parent, copy_children)
+        new_object.workspace.finalize()
+
+        return new_object
+
+    def _copy_to_parent(self, entity, parent, copy_children: bool = True):
+        """
+        Copy an entity to a different parent, without finalizing the target
+        workspace. See :obj:`~geoh5py.workspace.workspace.Workspace.copy_to_parent`.
+        """
 
         entity_kwargs: dict = {"entity": {}}
-        for key in entity.__dict__.keys():
+        for key in entity.__dict__:
             if key not in ["_uid", "_entity_type"]:
                 if key[0] == "_":
                     key = key[1:]
@@ -175,7 +185,7 @@ class Workspace:
                 entity_kwargs["entity"][key] = getattr(entity, key)
 
         entity_type_kwargs: dict = {"entity_type": {}}
-        for key in entity.entity_type.__dict__.keys():
+        for key in entity.entity_type.__dict__:
             if key not in ["_workspace"]:
                 if key[0] == "_":
                     key = key[1:]
@@ -207,11 +217,9 @@ class Workspace:
         if copy_children:
             for child in entity.children:
                 new_object.add_children(
-                    [self.copy_to_parent(child, parent=new_object, copy_children=True)]
+                    [self._copy_to_parent(child, parent=new_object, copy_children=True)]
                 )
 
-        new_object.workspace.finalize()
-
         return new_object
 
     @classmethod
@@ -285,13 +293,8 @@ class Workspace:
 
         :return entity: Newly created entity registered to the workspace
         """
-        entity_kwargs: dict = dict()
-        if "entity" in kwargs.keys():
-            entity_kwargs = kwargs["entity"]
-
-        entity_type_kwargs: dict = dict()
-        if "entity_type" in kwargs.keys():
-            entity_type_kwargs = kwargs["entity_type"]
+        entity_kwargs: dict = kwargs.get("entity", {})
+        entity_type_kwargs: dict = kwargs.get("entity_type", {})
 
         if entity_class is Data:
             created_entity = self.create_data(
@@ -343,7 +346,7 @@ class Workspace:
                 and issubclass(member, entity_class)
                 and member is not entity_class
                 and hasattr(member, "default_type_uid")
-                and not member == CustomGroup
+                and member is not CustomGroup
                 and member.default_type_uid() == entity_type_uid
             ):
                 entity_type = member.find_or_create_type(self, **entity_type_kwargs)
@@ -507,9 +510,8 @@ class Workspace:
         )
 
         for uid, child_type in children_list.items():
-            if self.get_entity(uid)[0] is not None:
-                recovered_object = self.get_entity(uid)[0]
-            else:
+            recovered_object = self.get_entity(uid)[0]
+            if recovered_object is None:
                 recovered_object = self.load_entity(uid, child_type, file=file)
 
             if recovered_object is not None:
@@ -708,9 +710,12 @@ class Workspace:
             list_entity_uid = [name]
 
         else:  # Extract all objects uuid with matching name
-            list_entity_uid = [
-                key for key, val in self.list_entities_name.items() if val == name
-            ]
+            list_entity_uid = []
+            for registry in [self._groups, self._objects, self._data]:
+                for key, val in registry.items():
+                    entity = val.__call__()
+                    if entity is not None and entity.name == name:
+                        list_entity_uid.append(key)
 
         entity_list: list[Entity | None] = []
         for uid in list_entity_uid:
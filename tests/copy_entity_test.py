@@ -19,7 +19,7 @@ import tempfile
 from pathlib import Path
 
 import numpy as np
-from scipy import spatial
+import pytest
 
 from geoh5py.objects import Curve, Octree, Points, Surface
 from geoh5py.shared.utils import compare_entities
@@ -27,8 +27,10 @@ from geoh5py.workspace import Workspace
 
 
 def test_copy_entity():
+    spatial = pytest.importorskip("scipy.spatial")
 
     # Generate a random cloud of points
+    np.random.seed(0)
     n_data = 12
     xyz = np.random.randn(n_data, 3)
 
@@ -19,7 +19,7 @@ import tempfile
 from pathlib import Path
 
 import numpy as np
-from scipy import spatial
+import pytest
 
 from geoh5py.objects import Surface
 from geoh5py.shared.utils import compare_entities
@@ -27,6 +27,7 @@ from geoh5py.workspace import Workspace
 
 
 def test_create_surface_data():
+    spatial = pytest.importorskip("scipy.spatial")
 
     with tempfile.TemporaryDirectory() as tempdir:
         h5file_path = Path(tempdir) / r"testSurface.geoh5"
@@ -34,6 +35,7 @@ def test_create_surface_data():
         workspace = Workspace(h5file_path)
 
         # Create a grid of points and triangulate
+        np.random.seed(0)
         x, y = np.meshgrid(np.arange(10), np.arange(10))
         x, y = x.ravel(), y.ravel()
         z = np.random.randn(x.shape[0])